@@ -1,15 +1,19 @@
 """Generic utilities."""
+from types import MappingProxyType
 from typing import (
-    Any, Dict, Hashable, Iterable, List, Optional, Sequence, Type, TypeVar,
+    Any, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Sequence, Type,
+    TypeVar,
 )
 
 import click
 
 from cloup.typing import MISSING, Possibly
 
-click_version_tuple = tuple(click.__version__.split('.'))
-click_major = int(click_version_tuple[0])
-click_minor = int(click_version_tuple[1])
+click_version_tuple = tuple(
+    int(part) for part in click.__version__.split('.')[:3] if part.isdigit()
+)
+click_major = click_version_tuple[0]
+click_minor = click_version_tuple[1]
 click_version_ge_8_1 = (click_major, click_minor) >= (8, 1)
 
 T = TypeVar('T')
@@ -30,9 +34,9 @@ def check_arg(condition: bool, msg: str = '') -> None:
         raise ValueError(msg)
 
 
-def indent_lines(lines: Iterable[str], width: int = 2) -> List[str]:
+def indent_lines(lines: Iterable[str], width: int = 2) -> Iterator[str]:
     spaces = ' ' * width
-    return [spaces + line for line in lines]
+    return (spaces + line for line in lines)
 
 
 def make_repr(
@@ -60,18 +64,15 @@ def make_repr(
     """
     cls_name = obj.__class__.__name__
     arglist = [
-        *(repr(arg) for arg in args),
+        *map(repr, args),
         *(f'{key}={value!r}' for key, value in kwargs.items()),
     ]
-    len_arglist = sum(len(s) for s in arglist)
-    total_len = len(cls_name) + len_arglist + 2 * len(arglist)
+    args_text = ', '.join(arglist)
+    total_len = len(cls_name) + len(args_text) + 2
     if 0 <= _line_len < total_len:
-        lines = indent_lines(arglist, width=_indent)
-        args_text = ',\n'.join(lines)
+        args_text = ',\n'.join(indent_lines(arglist, width=_indent))
         return f'{cls_name}(\n{args_text}\n)'
-    else:
-        args_text = ', '.join(arglist)
-        return f'{cls_name}({args_text})'
+    return f'{cls_name}({args_text})'
 
 
 def make_one_line_repr(obj: object, *args: Any, **kwargs: Any) -> str:
@@ -122,7 +123,9 @@ def identity(x: T) -> T:
 class FrozenSpaceMeta(type):
     def __init__(cls, *args: Any):
         super().__init__(*args)
-        d = {k: v for k, v in vars(cls).items() if not k.startswith('_')}
+        d = MappingProxyType({
+            k: v for k, v in vars(cls).items() if not k.startswith('_')
+        })
         type.__setattr__(cls, '_dict', d)
 
     def __setattr__(cls, key: str, value: Any) -> None:
@@ -134,7 +137,7 @@ class FrozenSpaceMeta(type):
                 "(e.g. __annotations__) are allowed to be set for compatibility reasons."
             )
 
-    def asdict(cls) -> Dict[str, Any]:
+    def asdict(cls) -> Mapping[str, Any]:
         return cls._dict  # type: ignore
 
     def __contains__(cls, item: str) -> bool:
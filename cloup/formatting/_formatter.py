@@ -1,8 +1,9 @@
 import dataclasses as dc
 import inspect
 import shutil
+import sys
 import textwrap
-from itertools import chain
+from functools import lru_cache
 from typing import (
     Any, Callable, Dict, Iterable, Iterator, Optional, Sequence, TYPE_CHECKING,
     Tuple, Union,
@@ -27,6 +28,23 @@ from cloup.styling import HelpTheme, IStyle
 Definition = Tuple[str, Union[str, Callable[[int], str]]]
 
 
+@lru_cache(maxsize=1)
+def _terminal_columns() -> int:
+    """Return the terminal width in columns, cached for the process lifetime:
+    a CLI run constructs multiple formatters and the terminal size doesn't
+    meaningfully change within a single run."""
+    return shutil.get_terminal_size((80, 100)).columns
+
+
+@lru_cache(maxsize=8)
+def _get_text_wrapper(width: int) -> textwrap.TextWrapper:
+    """Return a (cached) text wrapper equivalent to the one ``wrap_text``
+    builds on every call. Used to wrap single-paragraph texts without paying
+    for a new ``TextWrapper`` per row."""
+    from click._textwrap import TextWrapper
+    return TextWrapper(width, replace_whitespace=False)
+
+
 @dc.dataclass()
 class HelpSection:
     """A container for a help section data."""
@@ -44,6 +62,13 @@ class HelpSection:
     """(Optional) option group constraint description."""
 
 
+if sys.version_info >= (3, 10) and not TYPE_CHECKING:
+    # Recreate the class with slots for direct attribute access and a smaller
+    # footprint. Type checkers see the plain dataclass above, which has an
+    # identical interface; slots aren't supported by dataclasses on 3.8/3.9.
+    HelpSection = dc.dataclass(slots=True)(HelpSection)
+
+
 # noinspection PyMethodMayBeStatic
 class HelpFormatter(click.HelpFormatter):
     """
@@ -113,8 +138,13 @@ class HelpFormatter(click.HelpFormatter):
         row_sep: Union[None, str, 'SepGenerator', 'RowSepPolicy'] = None,
         theme: HelpTheme = HelpTheme(),
     ):
-        check_positive_int(col1_max_width, 'col1_max_width')
-        check_positive_int(col_spacing, 'col_spacing')
+        # Validity checks are inlined so that valid arguments (the normal case)
+        # don't pay a function call each; check_positive_int raises the
+        # appropriate error when a check fails.
+        if not (isinstance(col1_max_width, int) and col1_max_width > 0):
+            check_positive_int(col1_max_width, 'col1_max_width')
+        if not (isinstance(col_spacing, int) and col_spacing > 0):
+            check_positive_int(col_spacing, 'col_spacing')
         if isinstance(row_sep, str) and row_sep.endswith('\n'):
             raise ValueError(
                 "since v0.9, row_sep must not end with '\\n'. The formatter writes "
@@ -128,7 +158,7 @@ class HelpFormatter(click.HelpFormatter):
         width = (
             width
             or click.formatting.FORCED_WIDTH
-            or min(max_width, shutil.get_terminal_size((80, 100)).columns - 1)
+            or min(max_width, _terminal_columns() - 1)
         )
         super().__init__(
             width=width, max_width=max_width, indent_increment=indent_increment
@@ -139,6 +169,17 @@ class HelpFormatter(click.HelpFormatter):
         self.col_spacing = col_spacing
         self.theme = theme
         self.row_sep = row_sep
+        self._indent_cache: Dict[int, str] = {}
+
+    def _spaces(self, width: int) -> str:
+        """Return a string of ``width`` spaces, cached to avoid re-allocating
+        the same indentation strings over and over while rendering."""
+        cache = self._indent_cache
+        try:
+            return cache[width]
+        except KeyError:
+            spaces = cache[width] = " " * width
+            return spaces
 
     @staticmethod
     def settings(
@@ -195,7 +236,7 @@ class HelpFormatter(click.HelpFormatter):
 
     def write_heading(self, heading: str, newline: bool = True) -> None:
         if self.current_indent:
-            self.write(" " * self.current_indent)
+            self.write(self._spaces(self.current_indent))
         self.write(self.theme.heading(heading + ":"))
         if newline:
             self.write('\n')
@@ -211,12 +252,25 @@ class HelpFormatter(click.HelpFormatter):
 
     def write_aligned_sections(self, sections: Sequence[HelpSection]) -> None:
         """Write multiple aligned definition lists."""
-        all_rows = chain.from_iterable(dl.definitions for dl in sections)
-        col1_width = self.compute_col1_width(all_rows, self.col1_max_width)
-        for s in sections:
-            self.write_section(s, col1_width=col1_width)
+        # Fetch each ``definitions`` attribute once and reuse the list both for
+        # computing the column width and for writing the sections.
+        section_defs = [s.definitions for s in sections]
+        col1_width = max(
+            (length for length in (
+                unstyled_len(row[0]) for defs in section_defs for row in defs
+            ) if length <= self.col1_max_width),
+            default=0,
+        )
+        for s, defs in zip(sections, section_defs):
+            self.write_section(s, col1_width=col1_width, definitions=defs)
 
-    def write_section(self, s: HelpSection, col1_width: Optional[int] = None) -> None:
+    def write_section(
+        self, s: HelpSection,
+        col1_width: Optional[int] = None,
+        definitions: Optional[Sequence[Definition]] = None,
+    ) -> None:
+        if definitions is None:
+            definitions = s.definitions
         theme = self.theme
         self.write("\n")
         self.write_heading(s.heading, newline=not s.constraint)
@@ -233,13 +287,14 @@ class HelpFormatter(click.HelpFormatter):
         with self.indentation():
             if s.help:
                 self.write_text(s.help, theme.section_help)
-            self.write_dl(s.definitions, col1_width=col1_width)
+            self.write_dl(definitions, col1_width=col1_width)
 
     def write_text(self, text: str, style: IStyle = identity) -> None:
         wrapped = wrap_text(
             text, self.width - self.current_indent, preserve_paragraphs=True)
         if style is identity:
-            wrapped_text = textwrap.indent(wrapped, prefix=' ' * self.current_indent)
+            wrapped_text = textwrap.indent(
+                wrapped, prefix=self._spaces(self.current_indent))
         else:
             styled_lines = map(style, wrapped.splitlines())
             lines = indent_lines(styled_lines, width=self.current_indent)
@@ -247,9 +302,14 @@ class HelpFormatter(click.HelpFormatter):
         self.write(wrapped_text, "\n")
 
     def compute_col1_width(self, rows: Iterable[Definition], max_width: int) -> int:
-        col1_lengths = (unstyled_len(r[0]) for r in rows)
-        lengths_under_limit = (length for length in col1_lengths if length <= max_width)
-        return max(lengths_under_limit, default=0)
+        best = 0
+        for row in rows:
+            length = unstyled_len(row[0])
+            if length == max_width:
+                return max_width  # can't do better than this: stop scanning
+            if best < length <= max_width:
+                best = length
+        return best
 
     def write_dl(
         self, rows: Sequence[Definition],
@@ -330,43 +390,62 @@ class HelpFormatter(click.HelpFormatter):
         lists and it's the default if there's enough space."""
 
         col1_plus_spacing = col1_width + col_spacing
-        col2_indentation = " " * (
+        col2_indentation = self._spaces(
             self.current_indent + max(self.indent_increment, col1_plus_spacing)
         )
-        indentation = " " * self.current_indent
+        indentation = self._spaces(self.current_indent)
+        col2_line_sep = "\n" + col2_indentation
 
         # Note: iter_defs() resolves eventual callables in row[1]
         text_rows = list(iter_defs(rows, col2_width))
         row_sep = self._get_row_sep_for(text_rows, (col1_width, col2_width), col_spacing)
         col1_styler, col2_styler = self.theme.col1, self.theme.col2
+        col2_wrapper = _get_text_wrapper(col2_width)
+        write = self.write  # hoisted out of the row loop
 
-        def write_row(row: Tuple[str, str]) -> None:
+        def write_row(row: Tuple[str, str], prefix: str = "") -> None:
+            # Collect the parts of the row and write them with a single call:
+            # the buffer grows once per row rather than once per part.
             first, second = row
-            self.write(indentation, col1_styler(first))
+            parts = [prefix, indentation, col1_styler(first)]
             if not second:
-                self.write("\n")
+                parts.append("\n")
             else:
                 first_display_length = unstyled_len(first)
                 if first_display_length <= col1_width:
                     spaces_to_col2 = col1_plus_spacing - first_display_length
-                    self.write(" " * spaces_to_col2)
+                    parts.append(" " * spaces_to_col2)
                 else:
-                    self.write("\n", col2_indentation)
+                    parts += ("\n", col2_indentation)
 
                 if len(second) <= col2_width:
-                    self.write(col2_styler(second), "\n")
+                    parts += (col2_styler(second), "\n")
                 else:
-                    wrapped_text = wrap_text(second, col2_width, preserve_paragraphs=True)
-                    lines = [col2_styler(line) for line in wrapped_text.splitlines()]
-                    self.write(lines[0], "\n")
-                    for line in lines[1:]:
-                        self.write(col2_indentation, line, "\n")
-
+                    if (
+                        "\x08" in second
+                        or second[0] in " \t"
+                        or len(second.splitlines()) > 1
+                    ):
+                        # Multiple lines/paragraphs, no-rewrap escapes or
+                        # leading indentation: delegate to wrap_text, which
+                        # handles them (building a new TextWrapper in the
+                        # process).
+                        wrapped_text = wrap_text(
+                            second, col2_width, preserve_paragraphs=True)
+                        wrapped_lines = wrapped_text.splitlines()
+                    else:  # common case: single paragraph, use the cached wrapper
+                        wrapped_lines = col2_wrapper.wrap(second.expandtabs())
+                    parts += (
+                        col2_line_sep.join(map(col2_styler, wrapped_lines)), "\n"
+                    )
+            write("".join(parts))
+
+        # The separator (if any) is written as part of the next row, saving one
+        # buffer append per row.
+        sep_prefix = "" if row_sep is None else indentation + row_sep + "\n"
         write_row(text_rows[0])
         for row in text_rows[1:]:
-            if row_sep is not None:
-                self.write(indentation, row_sep, "\n")
-            write_row(row)
+            write_row(row, sep_prefix)
 
     def write_linear_dl(self, dl: Sequence[Definition]) -> None:
         """Format a definition list as a "linear list". This is the default when
@@ -375,18 +454,19 @@ class HelpFormatter(click.HelpFormatter):
         help_extra_indent = max(3, self.indent_increment)
         help_total_indent = self.current_indent + help_extra_indent
         help_max_width = self.width - help_total_indent
-        current_indentation = " " * self.current_indent
+        current_indentation = self._spaces(self.current_indent)
 
         col1_styler = self.theme.col1
         col2_styler = self.theme.col2
+        write = self.write  # hoisted out of the loop
 
         for names, help in iter_defs(dl, help_max_width):
-            self.write(current_indentation + col1_styler(names) + '\n')
+            write(current_indentation + col1_styler(names) + '\n')
             if help:
                 self.current_indent += help_extra_indent
                 self.write_text(help, col2_styler)
                 self.current_indent -= help_extra_indent
-            self.write("\n")
+            write("\n")
         self.buffer.pop()  # pop last newline
 
     def write_epilog(self, epilog: str) -> None:
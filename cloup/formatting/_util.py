@@ -24,4 +24,6 @@ def ensure_is_cloup_formatter(formatter: click.HelpFormatter) -> 'cloup.HelpForm
 
 
 def unstyled_len(string: str) -> int:
+    if '\x1b' not in string:  # fast path: no ANSI codes, nothing to strip
+        return len(string)
     return len(click.unstyle(string))
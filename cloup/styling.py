@@ -9,7 +9,7 @@ from typing import Any, Callable, Dict, Optional
 
 import click
 
-from cloup._util import FrozenSpace, click_version_tuple, delete_keys, identity
+from cloup._util import FrozenSpace, click_major, delete_keys, identity
 from cloup.typing import MISSING, Possibly
 
 IStyle = Callable[[str], str]
@@ -174,7 +174,7 @@ class Style:
         if self._style_kwargs is None:
             kwargs = dc.asdict(self)
             delete_keys(kwargs, ['text_transform', '_style_kwargs'])
-            if int(click_version_tuple[0]) < 8:
+            if click_major < 8:
                 # These arguments are not supported in Click < 8. Ignore them.
                 delete_keys(kwargs, ['overline', 'italic', 'strikethrough'])
             object.__setattr__(self, '_style_kwargs', kwargs)